@@ -0,0 +1,33 @@
+# cython: language_level=3
+"""news_clientホットパスのCython実装
+
+clean_html / is_ai_related はフィード更新のたびにエントリごとに呼ばれる
+ため、バイトコードディスパッチを避けるネイティブ版を用意する。
+ビルドしていない環境ではnews_client内の純Python版がそのまま使われる。
+
+ビルド: python setup.py build_ext --inplace
+"""
+import html as _html
+import re
+
+from news_client import AI_KEYWORDS
+
+cdef object _TAG_RE = re.compile(r'<[^>]+>')
+cdef object _WS_RE = re.compile(r'\s+')
+cdef object _AI_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(kw) for kw in AI_KEYWORDS) + r')\b',
+    re.IGNORECASE,
+)
+cdef object _unescape = _html.unescape
+
+
+cpdef str clean_html(str text):
+    """HTMLタグを除去"""
+    if not text:
+        return ''
+    return _WS_RE.sub(' ', _TAG_RE.sub('', _unescape(text))).strip()
+
+
+cpdef bint is_ai_related(str title, str summary):
+    """AI関連の記事かどうか判定"""
+    return _AI_RE.search(title) is not None or _AI_RE.search(summary) is not None
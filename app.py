@@ -1,17 +1,53 @@
 """AI/LLMニュースモニタリングWebアプリ"""
+import threading
+import time
+
 from flask import Flask, render_template, request, jsonify
-from news_client import fetch_all_news, NEWS_FEEDS
+from news_client import fetch_all_news, NewsBatch, NEWS_FEEDS
+
+# JSONシリアライズ（オプション）: orjsonは標準jsonより数倍速い
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+# バックグラウンド更新のニュースキャッシュ
+# リクエストごとにRSSを取得すると毎回数秒かかるため、定期更新した
+# スナップショットをメモリに保持し、リクエストはそれをフィルタするだけにする
+REFRESH_INTERVAL = 300  # 秒
+_NEWS_CACHE: NewsBatch | None = None
+_CACHE_LOCK = threading.RLock()
+
+# 翻訳済み記事のメモ（URLキー）: 更新のたびに同じ記事を再翻訳しないため
+_TRANSLATED: dict[str, tuple[str, str]] = {}
+_TRANSLATED_MAX = 1000
+
 # 翻訳機能（オプション）
 try:
-    from translator import translate_text
+    from translator import translate_batch
     TRANSLATION_ENABLED = True
 except ImportError:
     TRANSLATION_ENABLED = False
-    def translate_text(text):
-        return text
+    def translate_batch(texts):
+        return list(texts)
+
+
+def _refresh_news_loop():
+    """全フィードを定期取得してキャッシュを更新するバックグラウンドループ"""
+    global _NEWS_CACHE
+    while True:
+        try:
+            batch = fetch_all_news(None)
+            with _CACHE_LOCK:
+                _NEWS_CACHE = batch
+        except Exception as e:
+            print(f"News refresh error: {e}")
+        time.sleep(REFRESH_INTERVAL)
+
+
+threading.Thread(target=_refresh_news_loop, daemon=True).start()
 
 
 @app.route('/')
@@ -26,32 +62,70 @@ def index():
 @app.route('/api/news')
 def get_news():
     """ニュースAPIエンドポイント"""
+    global _NEWS_CACHE
     sources = request.args.getlist('sources')
     query = request.args.get('query', '').strip().lower()
 
-    news = fetch_all_news(sources if sources else None)
+    with _CACHE_LOCK:
+        news = _NEWS_CACHE
+
+    # 初回アクセス時（バックグラウンド更新が未完了）のみ同期で取得
+    if news is None:
+        news = fetch_all_news(None)
+        with _CACHE_LOCK:
+            _NEWS_CACHE = news
+
+    # ソースフィルタ
+    if sources:
+        wanted = set(sources)
+        news = news.select([i for i, s in enumerate(news.sources) if s in wanted])
 
     # キーワードフィルタ
     if query:
-        news = [n for n in news if query in n.title.lower() or query in n.summary.lower()]
+        news = news.select([
+            i for i, (t, s) in enumerate(zip(news.titles, news.summaries))
+            if query in t.lower() or query in s.lower()
+        ])
 
-    result = []
-    for n in news[:50]:
-        # タイトルと要約を日本語に翻訳（有効な場合）
-        title_ja = translate_text(n.title) if TRANSLATION_ENABLED else n.title
-        summary_ja = translate_text(n.summary) if TRANSLATION_ENABLED else n.summary
+    news = news.select(list(range(min(len(news), 50))))
+
+    if TRANSLATION_ENABLED:
+        # 未翻訳の記事だけをまとめて翻訳し、URLキーでメモ化する
+        # （記事ごとに翻訳APIを呼ぶとN往復になるため、1回のバッチ呼び出しに集約）
+        pending = [i for i, url in enumerate(news.urls) if url not in _TRANSLATED]
+        if pending:
+            texts = (
+                [news.titles[i] for i in pending]
+                + [news.summaries[i] for i in pending]
+            )
+            translated = translate_batch(texts)
+            with _CACHE_LOCK:
+                for i, title_ja, summary_ja in zip(
+                    pending, translated[:len(pending)], translated[len(pending):]
+                ):
+                    if len(_TRANSLATED) >= _TRANSLATED_MAX:
+                        _TRANSLATED.pop(next(iter(_TRANSLATED)))
+                    _TRANSLATED[news.urls[i]] = (title_ja, summary_ja)
 
+    result = []
+    for title, summary, url, source, published, image_url in zip(
+        news.titles, news.summaries, news.urls,
+        news.sources, news.published, news.image_urls,
+    ):
+        title_ja, summary_ja = _TRANSLATED.get(url, (title, summary))
         result.append({
             'title': title_ja,
-            'title_original': n.title,
+            'title_original': title,
             'summary': summary_ja,
-            'summary_original': n.summary,
-            'url': n.url,
-            'source': n.source,
-            'published': n.published.strftime('%Y-%m-%d %H:%M') if n.published else None,
-            'image_url': n.image_url,
+            'summary_original': summary,
+            'url': url,
+            'source': source,
+            'published': published.strftime('%Y-%m-%d %H:%M') if published else None,
+            'image_url': image_url,
         })
 
+    if orjson is not None:
+        return app.response_class(orjson.dumps(result), mimetype='application/json')
     return jsonify(result)
 
 
@@ -1,187 +1,215 @@
-"""arXiv API クライアント"""
-import urllib.request
-import urllib.parse
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
-
-
-@dataclass
-class Paper:
-    """論文データクラス"""
-    id: str
-    title: str
-    summary: str
-    authors: list[str]
-    published: datetime
-    updated: datetime
-    categories: list[str]
-    pdf_url: str
-    arxiv_url: str
-
-
-class ArxivClient:
-    """arXiv API クライアント"""
-
-    BASE_URL = "http://export.arxiv.org/api/query"
-    NAMESPACES = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'arxiv': 'http://arxiv.org/schemas/atom'
-    }
-
-    # AI/ML関連のカテゴリ
-    AI_CATEGORIES = [
-        'cs.AI',   # Artificial Intelligence
-        'cs.CL',   # Computation and Language (NLP)
-        'cs.LG',   # Machine Learning
-        'cs.CV',   # Computer Vision
-        'cs.NE',   # Neural and Evolutionary Computing
-        'stat.ML', # Machine Learning (Statistics)
-    ]
-
-    def search(
-        self,
-        query: Optional[str] = None,
-        categories: Optional[list[str]] = None,
-        max_results: int = 50,
-        sort_by: str = 'submittedDate',
-        sort_order: str = 'descending'
-    ) -> list[Paper]:
-        """
-        arXiv APIで論文を検索
-
-        Args:
-            query: 検索キーワード
-            categories: カテゴリリスト（例: ['cs.AI', 'cs.CL']）
-            max_results: 最大取得件数
-            sort_by: ソート基準（submittedDate, lastUpdatedDate, relevance）
-            sort_order: ソート順（ascending, descending）
-
-        Returns:
-            論文のリスト
-        """
-        # 検索クエリを構築
-        search_parts = []
-
-        if categories:
-            cat_query = ' OR '.join(f'cat:{cat}' for cat in categories)
-            search_parts.append(f'({cat_query})')
-        else:
-            # デフォルトでAI関連カテゴリを検索
-            cat_query = ' OR '.join(f'cat:{cat}' for cat in self.AI_CATEGORIES)
-            search_parts.append(f'({cat_query})')
-
-        if query:
-            # タイトルと要約で検索
-            search_parts.append(f'(ti:"{query}" OR abs:"{query}")')
-
-        search_query = ' AND '.join(search_parts)
-
-        # APIパラメータ
-        params = {
-            'search_query': search_query,
-            'start': 0,
-            'max_results': max_results,
-            'sortBy': sort_by,
-            'sortOrder': sort_order,
-        }
-
-        url = f"{self.BASE_URL}?{urllib.parse.urlencode(params)}"
-
-        # APIリクエスト
-        with urllib.request.urlopen(url, timeout=30) as response:
-            xml_data = response.read().decode('utf-8')
-
-        return self._parse_response(xml_data)
-
-    def _parse_response(self, xml_data: str) -> list[Paper]:
-        """XMLレスポンスをパース"""
-        root = ET.fromstring(xml_data)
-        papers = []
-
-        for entry in root.findall('atom:entry', self.NAMESPACES):
-            paper = self._parse_entry(entry)
-            if paper:
-                papers.append(paper)
-
-        return papers
-
-    def _parse_entry(self, entry: ET.Element) -> Optional[Paper]:
-        """エントリをPaperオブジェクトに変換"""
-        try:
-            # ID
-            id_elem = entry.find('atom:id', self.NAMESPACES)
-            arxiv_id = id_elem.text.split('/abs/')[-1] if id_elem is not None else ''
-
-            # タイトル
-            title_elem = entry.find('atom:title', self.NAMESPACES)
-            title = ' '.join(title_elem.text.split()) if title_elem is not None else ''
-
-            # 要約
-            summary_elem = entry.find('atom:summary', self.NAMESPACES)
-            summary = ' '.join(summary_elem.text.split()) if summary_elem is not None else ''
-
-            # 著者
-            authors = []
-            for author in entry.findall('atom:author', self.NAMESPACES):
-                name_elem = author.find('atom:name', self.NAMESPACES)
-                if name_elem is not None:
-                    authors.append(name_elem.text)
-
-            # 日付
-            published_elem = entry.find('atom:published', self.NAMESPACES)
-            published = datetime.fromisoformat(published_elem.text.replace('Z', '+00:00')) if published_elem is not None else datetime.now()
-
-            updated_elem = entry.find('atom:updated', self.NAMESPACES)
-            updated = datetime.fromisoformat(updated_elem.text.replace('Z', '+00:00')) if updated_elem is not None else datetime.now()
-
-            # カテゴリ
-            categories = []
-            for category in entry.findall('atom:category', self.NAMESPACES):
-                term = category.get('term')
-                if term:
-                    categories.append(term)
-
-            # URL
-            pdf_url = ''
-            arxiv_url = ''
-            for link in entry.findall('atom:link', self.NAMESPACES):
-                if link.get('title') == 'pdf':
-                    pdf_url = link.get('href', '')
-                elif link.get('rel') == 'alternate':
-                    arxiv_url = link.get('href', '')
-
-            return Paper(
-                id=arxiv_id,
-                title=title,
-                summary=summary,
-                authors=authors,
-                published=published,
-                updated=updated,
-                categories=categories,
-                pdf_url=pdf_url,
-                arxiv_url=arxiv_url,
-            )
-        except Exception:
-            return None
-
-
-# キーワードプリセット
-TRENDING_KEYWORDS = [
-    'LLM',
-    'Large Language Model',
-    'GPT',
-    'Transformer',
-    'RLHF',
-    'Chain of Thought',
-    'RAG',
-    'Retrieval Augmented',
-    'Multimodal',
-    'Vision Language',
-    'Diffusion',
-    'Agent',
-    'Reasoning',
-    'Fine-tuning',
-    'Prompt',
-]
+"""arXiv API クライアント"""
+import re
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 空白正規化（split/joinの中間リストを作らずC実装の1パスで置換する）
+_WS = re.compile(r'\s+')
+
+# 共有HTTPセッション: 接続プールでTCP/TLSハンドシェイクを呼び出し間で償却する
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+_SESSION = requests.Session()
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# XMLは5-10倍に圧縮できるので明示的に圧縮転送を交渉する
+# （brはbrotliパッケージがある場合のみ広告する。展開はrequests任せ）
+try:
+    import brotli  # noqa: F401
+    _SESSION.headers['Accept-Encoding'] = 'br, gzip'
+except ImportError:
+    _SESSION.headers['Accept-Encoding'] = 'gzip'
+
+
+@dataclass
+class Paper:
+    """論文データクラス"""
+    id: str
+    title: str
+    summary: str
+    authors: list[str]
+    published: datetime
+    updated: datetime
+    categories: list[str]
+    pdf_url: str
+    arxiv_url: str
+
+
+class ArxivClient:
+    """arXiv API クライアント"""
+
+    BASE_URL = "http://export.arxiv.org/api/query"
+    NAMESPACES = {
+        'atom': 'http://www.w3.org/2005/Atom',
+        'arxiv': 'http://arxiv.org/schemas/atom'
+    }
+
+    # コンパイル済みXPath（エントリごとのfind呼び出しをlibxml2のC実装に置き換える）
+    _XP_ENTRIES = etree.XPath('atom:entry', namespaces=NAMESPACES)
+    _XP_ID = etree.XPath('atom:id/text()', namespaces=NAMESPACES)
+    _XP_TITLE = etree.XPath('atom:title/text()', namespaces=NAMESPACES)
+    _XP_SUMMARY = etree.XPath('atom:summary/text()', namespaces=NAMESPACES)
+    _XP_AUTHORS = etree.XPath('atom:author/atom:name/text()', namespaces=NAMESPACES)
+    _XP_PUBLISHED = etree.XPath('atom:published/text()', namespaces=NAMESPACES)
+    _XP_UPDATED = etree.XPath('atom:updated/text()', namespaces=NAMESPACES)
+    _XP_CATEGORIES = etree.XPath('atom:category/@term', namespaces=NAMESPACES)
+    _XP_LINKS = etree.XPath('atom:link', namespaces=NAMESPACES)
+
+    # AI/ML関連のカテゴリ
+    AI_CATEGORIES = [
+        'cs.AI',   # Artificial Intelligence
+        'cs.CL',   # Computation and Language (NLP)
+        'cs.LG',   # Machine Learning
+        'cs.CV',   # Computer Vision
+        'cs.NE',   # Neural and Evolutionary Computing
+        'stat.ML', # Machine Learning (Statistics)
+    ]
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        categories: Optional[list[str]] = None,
+        max_results: int = 50,
+        sort_by: str = 'submittedDate',
+        sort_order: str = 'descending'
+    ) -> list[Paper]:
+        """
+        arXiv APIで論文を検索
+
+        Args:
+            query: 検索キーワード
+            categories: カテゴリリスト（例: ['cs.AI', 'cs.CL']）
+            max_results: 最大取得件数
+            sort_by: ソート基準（submittedDate, lastUpdatedDate, relevance）
+            sort_order: ソート順（ascending, descending）
+
+        Returns:
+            論文のリスト
+        """
+        # 検索クエリを構築
+        search_parts = []
+
+        if categories:
+            cat_query = ' OR '.join(f'cat:{cat}' for cat in categories)
+            search_parts.append(f'({cat_query})')
+        else:
+            # デフォルトでAI関連カテゴリを検索
+            cat_query = ' OR '.join(f'cat:{cat}' for cat in self.AI_CATEGORIES)
+            search_parts.append(f'({cat_query})')
+
+        if query:
+            # タイトルと要約で検索
+            search_parts.append(f'(ti:"{query}" OR abs:"{query}")')
+
+        search_query = ' AND '.join(search_parts)
+
+        # APIパラメータ
+        params = {
+            'search_query': search_query,
+            'start': 0,
+            'max_results': max_results,
+            'sortBy': sort_by,
+            'sortOrder': sort_order,
+        }
+
+        url = f"{self.BASE_URL}?{urllib.parse.urlencode(params)}"
+
+        # APIリクエスト
+        response = _SESSION.get(url, timeout=30)
+        response.raise_for_status()
+
+        return self._parse_response(response.text)
+
+    def _parse_response(self, xml_data: str) -> list[Paper]:
+        """XMLレスポンスをパース"""
+        root = etree.fromstring(xml_data.encode('utf-8'))
+        papers = []
+
+        for entry in self._XP_ENTRIES(root):
+            paper = self._parse_entry(entry)
+            if paper:
+                papers.append(paper)
+
+        return papers
+
+    def _parse_entry(self, entry) -> Optional[Paper]:
+        """エントリをPaperオブジェクトに変換"""
+        try:
+            # ID
+            ids = self._XP_ID(entry)
+            arxiv_id = ids[0].split('/abs/')[-1] if ids else ''
+
+            # タイトル
+            titles = self._XP_TITLE(entry)
+            title = _WS.sub(' ', titles[0]).strip() if titles else ''
+
+            # 要約
+            summaries = self._XP_SUMMARY(entry)
+            summary = _WS.sub(' ', summaries[0]).strip() if summaries else ''
+
+            # 著者
+            authors = [str(name) for name in self._XP_AUTHORS(entry)]
+
+            # 日付
+            published_texts = self._XP_PUBLISHED(entry)
+            published = datetime.fromisoformat(published_texts[0].replace('Z', '+00:00')) if published_texts else datetime.now()
+
+            updated_texts = self._XP_UPDATED(entry)
+            updated = datetime.fromisoformat(updated_texts[0].replace('Z', '+00:00')) if updated_texts else datetime.now()
+
+            # カテゴリ
+            categories = [str(term) for term in self._XP_CATEGORIES(entry)]
+
+            # URL
+            pdf_url = ''
+            arxiv_url = ''
+            for link in self._XP_LINKS(entry):
+                if link.get('title') == 'pdf':
+                    pdf_url = link.get('href', '')
+                elif link.get('rel') == 'alternate':
+                    arxiv_url = link.get('href', '')
+
+            return Paper(
+                id=arxiv_id,
+                title=title,
+                summary=summary,
+                authors=authors,
+                published=published,
+                updated=updated,
+                categories=categories,
+                pdf_url=pdf_url,
+                arxiv_url=arxiv_url,
+            )
+        except Exception:
+            return None
+
+
+# キーワードプリセット
+TRENDING_KEYWORDS = [
+    'LLM',
+    'Large Language Model',
+    'GPT',
+    'Transformer',
+    'RLHF',
+    'Chain of Thought',
+    'RAG',
+    'Retrieval Augmented',
+    'Multimodal',
+    'Vision Language',
+    'Diffusion',
+    'Agent',
+    'Reasoning',
+    'Fine-tuning',
+    'Prompt',
+]
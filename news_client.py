@@ -1,12 +1,34 @@
 """AI/LLMニュースRSSクライアント"""
+import asyncio
+import io
+import os
 import feedparser
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 import re
 import html
 
+import aiohttp
+from lxml import etree
+
+# ソート高速化用（オプション）
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# フィードXMLは5-10倍に圧縮できるので明示的に圧縮転送を交渉する
+# （brはbrotliパッケージがある場合のみ広告する。展開はaiohttp任せ）
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip'
+
 
 @dataclass
 class NewsItem:
@@ -17,6 +39,67 @@ class NewsItem:
     source: str
     published: Optional[datetime]
     image_url: Optional[str]
+    # ソート用タイムスタンプ（パース時に1度だけ計算。日付なしは0.0）
+    published_ts: float = 0.0
+
+    def __post_init__(self):
+        if not self.published_ts and self.published:
+            self.published_ts = self.published.timestamp()
+
+
+@dataclass
+class NewsBatch:
+    """ニュース記事のカラム指向バッチ（SoA）
+
+    キャッシュされたスナップショットのフィルタ・ソートが属性アクセス
+    越しにならないよう、フィールドごとの並列リストで保持する。
+    """
+    titles: list[str]
+    summaries: list[str]
+    urls: list[str]
+    sources: list[str]
+    published: list[Optional[datetime]]
+    published_ts: list[float]
+    image_urls: list[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @classmethod
+    def from_items(cls, items: list[NewsItem]) -> 'NewsBatch':
+        return cls(
+            titles=[i.title for i in items],
+            summaries=[i.summary for i in items],
+            urls=[i.url for i in items],
+            sources=[i.source for i in items],
+            published=[i.published for i in items],
+            published_ts=[i.published_ts for i in items],
+            image_urls=[i.image_url for i in items],
+        )
+
+    def select(self, indices: list[int]) -> 'NewsBatch':
+        """指定インデックスの行だけを持つ新しいバッチを返す"""
+        return NewsBatch(
+            titles=[self.titles[i] for i in indices],
+            summaries=[self.summaries[i] for i in indices],
+            urls=[self.urls[i] for i in indices],
+            sources=[self.sources[i] for i in indices],
+            published=[self.published[i] for i in indices],
+            published_ts=[self.published_ts[i] for i in indices],
+            image_urls=[self.image_urls[i] for i in indices],
+        )
+
+    def sorted_by_published_desc(self) -> 'NewsBatch':
+        """日付の新しい順に並べたバッチを返す"""
+        if np is not None:
+            order = np.argsort(-np.asarray(self.published_ts), kind='stable').tolist()
+        else:
+            order = sorted(
+                range(len(self)),
+                key=self.published_ts.__getitem__,
+                reverse=True,
+            )
+        return self.select(order)
 
 
 # AI関連のRSSフィード
@@ -40,14 +123,17 @@ AI_KEYWORDS = [
 ]
 
 
+# 事前コンパイル済み正規表現（エントリごとの呼び出しで再コンパイルしない）
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_IMG_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
+
+
 def clean_html(text: str) -> str:
     """HTMLタグを除去"""
     if not text:
         return ''
-    text = html.unescape(text)
-    text = re.sub(r'<[^>]+>', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return _WS_RE.sub(' ', _TAG_RE.sub('', html.unescape(text))).strip()
 
 
 def extract_image(entry) -> Optional[str]:
@@ -75,7 +161,7 @@ def extract_image(entry) -> Optional[str]:
     elif hasattr(entry, 'summary'):
         content = entry.summary or ''
 
-    img_match = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', content)
+    img_match = _IMG_RE.search(content)
     if img_match:
         return img_match.group(1)
 
@@ -97,52 +183,290 @@ def parse_date(entry) -> Optional[datetime]:
     return None
 
 
+# 全キーワードを1つの選択肢パターンにまとめる（28回のサブストリング走査を1パスに）
+_AI_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(kw) for kw in AI_KEYWORDS) + r')\b',
+    re.IGNORECASE,
+)
+
+
 def is_ai_related(title: str, summary: str) -> bool:
     """AI関連の記事かどうか判定"""
-    text = (title + ' ' + summary).lower()
-    return any(kw in text for kw in AI_KEYWORDS)
+    return _AI_RE.search(title) is not None or _AI_RE.search(summary) is not None
+
+
+# Cython拡張がビルドされていれば差し替える（オプション）
+try:
+    import _news_native
+    clean_html = _news_native.clean_html
+    is_ai_related = _news_native.is_ai_related
+except ImportError:
+    pass
+
+
+# is_ai_relatedの判定結果キャッシュ（URLキー、古いものから破棄）
+# 更新間隔の間にフィード内容はほとんど変わらないため、大半のエントリで
+# キーワード走査を省略できる
+_AI_VERDICT: OrderedDict[str, bool] = OrderedDict()
+_AI_VERDICT_MAX = 5000
+
+
+def _ai_verdict(url: str, title: str, summary: str) -> bool:
+    """URLをキーにis_ai_relatedの結果をキャッシュして返す"""
+    if url and url in _AI_VERDICT:
+        return _AI_VERDICT[url]
+    verdict = is_ai_related(title, summary)
+    if url:
+        if len(_AI_VERDICT) >= _AI_VERDICT_MAX:
+            _AI_VERDICT.popitem(last=False)
+        _AI_VERDICT[url] = verdict
+    return verdict
+
+
+# パースするエントリ数の上限（元のfeedparser版の entries[:20] と同じ）
+MAX_ENTRIES = 20
+
+# XML名前空間
+_ATOM_NS = 'http://www.w3.org/2005/Atom'
+_MEDIA_NS = 'http://search.yahoo.com/mrss/'
+_CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+
+
+def parse_date_str(value: Optional[str]) -> Optional[datetime]:
+    """日付文字列（ISO 8601 / RFC 822）をパース"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    # ソート用にnaive UTCへ揃える（feedparser版のpublished_parsedと同じ基準）
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _extract_image_xml(elem, content: str) -> Optional[str]:
+    """lxmlエントリ要素から画像URLを抽出"""
+    # media:content
+    for media in elem.iter(f'{{{_MEDIA_NS}}}content'):
+        if media.get('medium') == 'image' or media.get('url', '').endswith(('.jpg', '.png', '.webp')):
+            return media.get('url')
+
+    # media:thumbnail
+    thumb = elem.find(f'{{{_MEDIA_NS}}}thumbnail')
+    if thumb is not None:
+        return thumb.get('url')
+
+    # enclosure（RSS） / link rel="enclosure"（Atom）
+    for enc in elem.iter('enclosure'):
+        if enc.get('type', '').startswith('image/'):
+            return enc.get('url')
+    for link in elem.iter(f'{{{_ATOM_NS}}}link'):
+        if link.get('rel') == 'enclosure' and link.get('type', '').startswith('image/'):
+            return link.get('href')
+
+    # content内の画像
+    img_match = _IMG_RE.search(content)
+    if img_match:
+        return img_match.group(1)
+
+    return None
+
+
+def _parse_entry_xml(name: str, elem) -> Optional[NewsItem]:
+    """<item>（RSS）/ <entry>（Atom）要素をNewsItemに変換"""
+    if elem.tag == f'{{{_ATOM_NS}}}entry':
+        title = clean_html(elem.findtext(f'{{{_ATOM_NS}}}title') or '')
+        raw_summary = (
+            elem.findtext(f'{{{_ATOM_NS}}}summary')
+            or elem.findtext(f'{{{_ATOM_NS}}}content')
+            or ''
+        )
+        url = ''
+        for link in elem.findall(f'{{{_ATOM_NS}}}link'):
+            if link.get('rel', 'alternate') == 'alternate':
+                url = link.get('href', '')
+                break
+        published = parse_date_str(
+            elem.findtext(f'{{{_ATOM_NS}}}published')
+            or elem.findtext(f'{{{_ATOM_NS}}}updated')
+        )
+    else:
+        title = clean_html(elem.findtext('title') or '')
+        raw_summary = (
+            elem.findtext('description')
+            or elem.findtext(f'{{{_CONTENT_NS}}}encoded')
+            or ''
+        )
+        url = (elem.findtext('link') or '').strip()
+        published = parse_date_str(elem.findtext('pubDate'))
+
+    summary = clean_html(raw_summary)
+
+    # AI関連でない記事はスキップ（一部のフィードはAI専用でないため）
+    if 'AI' not in name and not _ai_verdict(url, title, summary):
+        return None
+
+    return NewsItem(
+        title=title,
+        summary=summary[:300] + '...' if len(summary) > 300 else summary,
+        url=url,
+        source=name,
+        published=published,
+        image_url=_extract_image_xml(elem, raw_summary),
+    )
+
+
+def _parse_feed_xml(name: str, data: bytes) -> list[NewsItem]:
+    """lxml iterparseでフィードをストリームパース
+
+    feedparserはHTMLサニタイズや相対URI解決で全エントリに時間をかけるが、
+    使うのは先頭MAX_ENTRIES件だけなので、必要な要素だけC実装で抜き出して
+    打ち切る。
+    """
+    items = []
+    seen = 0
+    for _, elem in etree.iterparse(
+        io.BytesIO(data),
+        events=('end',),
+        tag=('item', f'{{{_ATOM_NS}}}entry'),
+        recover=True,
+    ):
+        seen += 1
+        item = _parse_entry_xml(name, elem)
+        if item:
+            items.append(item)
+        elem.clear()
+        if seen >= MAX_ENTRIES:
+            break
+    return items
 
 
-def fetch_feed(name: str, url: str) -> list[NewsItem]:
-    """単一フィードを取得"""
+def _parse_feed_feedparser(name: str, data: bytes) -> list[NewsItem]:
+    """feedparserによるパース（lxmlが扱えないフィードのフォールバック）"""
+    feed = feedparser.parse(data)
+    items = []
+
+    for entry in feed.entries[:MAX_ENTRIES]:
+        title = clean_html(entry.get('title', ''))
+        summary = clean_html(entry.get('summary', entry.get('description', '')))
+        url = entry.get('link', '')
+
+        # AI関連でない記事はスキップ（一部のフィードはAI専用でないため）
+        if 'AI' not in name and not _ai_verdict(url, title, summary):
+            continue
+
+        items.append(NewsItem(
+            title=title,
+            summary=summary[:300] + '...' if len(summary) > 300 else summary,
+            url=url,
+            source=name,
+            published=parse_date(entry),
+            image_url=extract_image(entry),
+        ))
+
+    return items
+
+
+def parse_feed(name: str, data: bytes) -> list[NewsItem]:
+    """取得済みフィード本文をパース"""
     try:
-        feed = feedparser.parse(url)
-        items = []
-
-        for entry in feed.entries[:20]:
-            title = clean_html(entry.get('title', ''))
-            summary = clean_html(entry.get('summary', entry.get('description', '')))
-
-            # AI関連でない記事はスキップ（一部のフィードはAI専用でないため）
-            if 'AI' not in name and not is_ai_related(title, summary):
-                continue
-
-            items.append(NewsItem(
-                title=title,
-                summary=summary[:300] + '...' if len(summary) > 300 else summary,
-                url=entry.get('link', ''),
-                source=name,
-                published=parse_date(entry),
-                image_url=extract_image(entry),
-            ))
-
-        return items
+        items = _parse_feed_xml(name, data)
+        if items:
+            return items
     except Exception as e:
-        print(f"Error fetching {name}: {e}")
+        print(f"lxml parse failed for {name}, falling back to feedparser: {e}")
+
+    try:
+        return _parse_feed_feedparser(name, data)
+    except Exception as e:
+        print(f"Error parsing {name}: {e}")
         return []
 
 
-def fetch_all_news(sources: Optional[list[str]] = None) -> list[NewsItem]:
-    """全フィードからニュースを取得"""
-    feeds_to_fetch = {k: v for k, v in NEWS_FEEDS.items() if not sources or k in sources}
+# パース用プロセスプール（feedparserのパースはCPUバウンドのため並列化）
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PARSE_POOL
+
+
+# 条件付きGET用の状態: URLごとのETag/Last-Modifiedと、前回パースした結果
+# 多くのフィードは304 Not Modifiedを返せるので、未変更なら転送もパースも省略できる
+_FEED_META: dict[str, dict] = {}
+_FEED_ITEMS: dict[str, list[NewsItem]] = {}
+_NOT_MODIFIED = object()
 
-    all_items = []
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        futures = [executor.submit(fetch_feed, name, url) for name, url in feeds_to_fetch.items()]
-        for future in futures:
-            all_items.extend(future.result())
 
-    # 日付でソート（新しい順）
-    all_items.sort(key=lambda x: x.published or datetime.min, reverse=True)
+async def _fetch_body(session: aiohttp.ClientSession, name: str, url: str):
+    """単一フィードの本文を取得（未変更なら_NOT_MODIFIED）"""
+    headers = {}
+    meta = _FEED_META.get(url)
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return _NOT_MODIFIED
+            body = await response.read()
+            _FEED_META[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+            return body
+    except Exception as e:
+        print(f"Error fetching {name}: {e}")
+        return None
+
+
+async def _fetch_all(feeds: dict[str, str]) -> list[NewsItem]:
+    """全フィードを並行取得し、パースをプロセスプールに振り分ける"""
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(
+        timeout=timeout,
+        headers={'Accept-Encoding': _ACCEPT_ENCODING},
+    ) as session:
+        bodies = await asyncio.gather(
+            *[_fetch_body(session, name, url) for name, url in feeds.items()]
+        )
+
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+
+    all_items: list[NewsItem] = []
+    to_parse: list[tuple[str, asyncio.Future]] = []
+    for (name, url), body in zip(feeds.items(), bodies):
+        if body is _NOT_MODIFIED:
+            # 304: 前回のパース結果をそのまま使う
+            all_items.extend(_FEED_ITEMS.get(url, []))
+        elif body:
+            to_parse.append((url, loop.run_in_executor(pool, parse_feed, name, body)))
+
+    parsed = await asyncio.gather(*[future for _, future in to_parse])
+    for (url, _), items in zip(to_parse, parsed):
+        _FEED_ITEMS[url] = items
+        all_items.extend(items)
 
     return all_items
+
+
+def fetch_all_news(sources: Optional[list[str]] = None) -> NewsBatch:
+    """全フィードからニュースを取得（日付の新しい順）"""
+    feeds_to_fetch = {k: v for k, v in NEWS_FEEDS.items() if not sources or k in sources}
+
+    all_items = asyncio.run(_fetch_all(feeds_to_fetch))
+
+    return NewsBatch.from_items(all_items).sorted_by_published_desc()
@@ -0,0 +1,11 @@
+"""Cython拡張（_news_native）のビルド用
+
+python setup.py build_ext --inplace
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='ai-monitor-native',
+    ext_modules=cythonize('_news_native.pyx'),
+)
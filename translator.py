@@ -1,26 +1,191 @@
-"""翻訳モジュール"""
-from functools import lru_cache
-
-try:
-    from deep_translator import GoogleTranslator
-    translator = GoogleTranslator(source='auto', target='ja')
-    AVAILABLE = True
-except ImportError:
-    AVAILABLE = False
-    translator = None
-
-
-@lru_cache(maxsize=500)
-def translate_text(text: str) -> str:
-    """テキストを日本語に翻訳（キャッシュ付き）"""
-    if not text or not text.strip() or not AVAILABLE:
-        return text
-
-    try:
-        # 長すぎるテキストは分割
-        if len(text) > 4500:
-            text = text[:4500]
-        return translator.translate(text)
-    except Exception as e:
-        print(f"Translation error: {e}")
-        return text
+"""翻訳モジュール"""
+import os
+import re
+import threading
+import time
+
+import translator_cache
+
+try:
+    from deep_translator import GoogleTranslator
+    translator = GoogleTranslator(source='auto', target='ja')
+    AVAILABLE = True
+except ImportError:
+    AVAILABLE = False
+    translator = None
+
+# ローカル翻訳モデル（オプション）: Google翻訳のネットワーク往復を丸ごと省く
+# int8量子化したNLLBをctranslate2でバッチ推論する。有効化するには
+#   ct2-transformers-converter --model facebook/nllb-200-distilled-600M \
+#       --quantization int8 --output_dir nllb_ct2
+# で変換し、AI_MONITOR_LOCAL_MT=nllb_ct2 を設定する
+_LOCAL_TOKENIZER_MODEL = 'facebook/nllb-200-distilled-600M'
+_LOCAL_TARGET_LANG = 'jpn_Jpan'
+_local_translator = None
+_local_tokenizer = None
+
+_local_model_dir = os.environ.get('AI_MONITOR_LOCAL_MT')
+if _local_model_dir:
+    try:
+        import ctranslate2
+        from transformers import AutoTokenizer
+        _local_translator = ctranslate2.Translator(_local_model_dir, device='auto')
+        _local_tokenizer = AutoTokenizer.from_pretrained(
+            _LOCAL_TOKENIZER_MODEL, src_lang='eng_Latn'
+        )
+        AVAILABLE = True
+    except Exception as e:
+        print(f"Local translation model unavailable: {e}")
+        _local_translator = None
+        _local_tokenizer = None
+
+# 翻訳結果キャッシュL1（挿入順で古いものから破棄）。
+# L2としてtranslator_cacheのディスクキャッシュを併用し、再起動後も保持する
+_CACHE: dict[str, str] = {}
+_CACHE_MAX = 5000
+
+
+def _cache_get(text: str) -> str | None:
+    """キャッシュ済みの翻訳を取得（なければNone）"""
+    cached = _CACHE.get(text)
+    if cached is not None:
+        return cached
+    cached = translator_cache.get(text)
+    if cached is not None:
+        _cache_local(text, cached)
+    return cached
+
+
+def _cache_local(text: str, result: str) -> None:
+    """L1（メモリ）にだけ保存"""
+    if len(_CACHE) >= _CACHE_MAX:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[text] = result
+
+
+def _cache_set(text: str, result: str) -> None:
+    """翻訳結果をL1・L2キャッシュに保存"""
+    _cache_local(text, result)
+    translator_cache.set(text, result)
+
+
+# ひらがな・カタカナ・漢字
+_JA_RE = re.compile(r'[぀-ヿ一-鿿]')
+
+
+def _should_skip(text: str) -> bool:
+    """翻訳不要なテキストか判定
+
+    極端に短い文字列やすでに日本語を含む文字列は、ネットワーク往復を
+    払わずそのまま返す。
+    """
+    return len(text) < 4 or _JA_RE.search(text) is not None
+
+
+def _truncate(text: str) -> str:
+    """長すぎるテキストは分割"""
+    return text[:4500] if len(text) > 4500 else text
+
+
+def _translate_local_batch(texts: list[str]) -> list[str]:
+    """ローカルモデルでバッチ翻訳"""
+    token_lists = [
+        _local_tokenizer.convert_ids_to_tokens(_local_tokenizer.encode(t))
+        for t in texts
+    ]
+    results = _local_translator.translate_batch(
+        token_lists,
+        target_prefix=[[_LOCAL_TARGET_LANG]] * len(token_lists),
+        beam_size=1,
+        max_batch_size=32,
+    )
+    translated = []
+    for result in results:
+        tokens = result.hypotheses[0][1:]  # 先頭の言語タグを除去
+        translated.append(
+            _local_tokenizer.decode(_local_tokenizer.convert_tokens_to_ids(tokens))
+        )
+    return translated
+
+
+# 翻訳APIへの同時リクエスト数の上限（バルクヘッド）
+# 複数の/api/newsリクエストが同時に翻訳を流すとレート制限を踏んで
+# 結果ごと捨てることになるため、流量を平滑化する
+_API_SEMAPHORE = threading.Semaphore(8)
+_API_WAIT_TIMEOUT = 10   # 秒。これ以上待つくらいなら原文で応答する
+_API_RETRIES = 3
+_API_BACKOFF = 0.5       # 秒（指数バックオフ: 0.5, 1.0, 2.0）
+
+
+def _translate_pending(texts: list[str]) -> list[str]:
+    """未翻訳テキストのバッチを実際に翻訳する（ローカル優先）
+
+    API呼び出しはセマフォで同時実行数を絞り、一時的な失敗は指数バック
+    オフ付きで再試行する。セマフォ待ちが長すぎる場合は例外を上げ、
+    呼び出し側のフォールバック（原文のまま返す）に任せる。
+    """
+    if _local_translator is not None:
+        return _translate_local_batch(texts)
+
+    if not _API_SEMAPHORE.acquire(timeout=_API_WAIT_TIMEOUT):
+        raise TimeoutError('translation API is saturated; serving original text')
+    try:
+        for attempt in range(_API_RETRIES):
+            try:
+                return translator.translate_batch(texts)
+            except Exception:
+                if attempt == _API_RETRIES - 1:
+                    raise
+                time.sleep(_API_BACKOFF * (2 ** attempt))
+    finally:
+        _API_SEMAPHORE.release()
+
+
+def translate_text(text: str) -> str:
+    """テキストを日本語に翻訳（キャッシュ付き）"""
+    if not text or not text.strip() or not AVAILABLE or _should_skip(text):
+        return text
+
+    cached = _cache_get(text)
+    if cached is not None:
+        return cached
+
+    try:
+        result = _translate_pending([_truncate(text)])[0]
+        _cache_set(text, result)
+        return result
+    except Exception as e:
+        print(f"Translation error: {e}")
+        return text
+
+
+def translate_batch(texts: list[str]) -> list[str]:
+    """複数テキストを1回のAPI呼び出しでまとめて翻訳
+
+    キャッシュ済み・空のテキストはスキップし、残りを重複排除して
+    API呼び出し1回に集約する。戻り値は入力と同じ順序・同じ長さ。
+    """
+    if not AVAILABLE:
+        return list(texts)
+
+    # 未翻訳のテキストだけを重複排除して収集
+    pending: list[str] = []
+    seen: set[str] = set()
+    for text in texts:
+        if (
+            text and text.strip() and not _should_skip(text)
+            and text not in seen and _cache_get(text) is None
+        ):
+            pending.append(text)
+            seen.add(text)
+
+    if pending:
+        try:
+            results = _translate_pending([_truncate(t) for t in pending])
+            for text, result in zip(pending, results):
+                if result:
+                    _cache_set(text, result)
+        except Exception as e:
+            print(f"Translation error: {e}")
+
+    return [_cache_get(t) or t for t in texts]
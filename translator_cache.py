@@ -0,0 +1,41 @@
+"""翻訳結果の永続キャッシュ（ディスクL2）
+
+プロセス内キャッシュは再起動で消えて翻訳APIを払い直すことになるため、
+コンテンツハッシュをキーにディスクへも保存し、再起動・複数ワーカー間で
+翻訳結果を共有する。
+"""
+import hashlib
+
+try:
+    import diskcache
+    _cache = diskcache.Cache('/tmp/ai-monitor-tx')
+    AVAILABLE = True
+except ImportError:
+    _cache = None
+    AVAILABLE = False
+
+EXPIRE = 86400 * 30  # 30日
+
+
+def _key(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def get(text: str) -> str | None:
+    """ディスクキャッシュから翻訳を取得（なければNone）"""
+    if not AVAILABLE:
+        return None
+    try:
+        return _cache.get(_key(text))
+    except Exception:
+        return None
+
+
+def set(text: str, result: str) -> None:
+    """翻訳結果をディスクキャッシュに保存"""
+    if not AVAILABLE:
+        return
+    try:
+        _cache.set(_key(text), result, expire=EXPIRE)
+    except Exception:
+        pass